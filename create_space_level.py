@@ -10,108 +10,206 @@ How to use:
    - Tools → Execute Python Script → Select this file
 
 This will create /Game/Maps/SpaceLevel automatically!
+
+For scripted/batch runs pass flags to skip the confirmation dialogs:
+    py "create_space_level.py" --overwrite --no-open
 """
 
-import unreal
+import argparse
+import sys
+from contextlib import contextmanager
+
+try:
+    import unreal
+except ImportError:  # not running inside the Unreal Editor
+    unreal = None
+
+# Instructions logged once SpaceLevel is ready
+_SUCCESS_BANNER = "\n".join([
+    "=" * 60,
+    "🎮 READY TO PLAY!",
+    "=" * 60,
+    "Press the PLAY button (or Alt+P) to start the game!",
+    "",
+    "The game will automatically:",
+    "  • Spawn your ship",
+    "  • Create lighting",
+    "  • Generate asteroids and AI ships",
+    "  • Display the HUD with controls",
+    "",
+    "Controls:",
+    "  • W/S - Forward/Backward",
+    "  • A/D - Strafe",
+    "  • Space/Shift - Up/Down",
+    "  • Arrow Keys - Pitch/Yaw",
+    "  • Q/E - Roll",
+    "  • B - Brake",
+    "=" * 60,
+])
+
+def _is_unattended():
+    """Return True when the editor cannot show modal dialogs"""
+    return "-unattended" in unreal.SystemLibrary.get_command_line().lower()
+
+def _confirm(title, message, choice, headless_default):
+    """Resolve a YES/NO choice, only prompting when it wasn't given and the editor is interactive"""
+    if choice is not None:
+        return choice
+    if _is_unattended():
+        return headless_default
+    result = unreal.EditorDialog.show_message(title, message, unreal.AppMsgType.YES_NO)
+    return result == unreal.AppReturnType.YES
+
+@contextmanager
+def _batched_editor_updates(description, work):
+    """Show one progress dialog and switch viewports to game view while creating assets
+    
+    Game view skips editor-only viewport drawing while assets are being created;
+    the previous view mode is restored on exit.
+    """
+    level_editor = unreal.get_editor_subsystem(unreal.LevelEditorSubsystem)
+    was_game_view = level_editor.editor_get_game_view()
+    level_editor.editor_set_game_view(True)
+    try:
+        with unreal.ScopedSlowTask(work, description) as task:
+            task.make_dialog(True)
+            yield task
+    finally:
+        level_editor.editor_set_game_view(was_game_view)
 
-def create_space_level():
-    """Create the SpaceLevel map automatically"""
+def create_levels(levels, overwrite=None):
+    """Create a World asset for each (asset_name, package_path) pair
+    
+    All new levels are saved together in one batch at the end. Returns the
+    full paths of the levels that were created.
+    """
     
     # Set up asset tools
     asset_tools = unreal.AssetToolsHelpers.get_asset_tools()
     editor_asset_lib = unreal.EditorAssetLibrary()
+    world_factory = unreal.WorldFactory()
+    
+    # Existence checks query the in-memory asset registry; make sure its
+    # initial scan has finished once rather than per lookup
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    if asset_registry.is_loading_assets():
+        asset_registry.wait_for_completion()
+    
+    # Resolve directories and overwrite prompts up front so no modal dialog
+    # opens while the progress dialog is showing
+    pending = []
+    for asset_name, package_path in levels:
+        full_path = f"{package_path}/{asset_name}"
+        
+        # Create the directory if it doesn't exist
+        if not editor_asset_lib.does_directory_exist(package_path):
+            editor_asset_lib.make_directory(package_path)
+            unreal.log(f"Created directory: {package_path}")
+        
+        # Check if level already exists
+        if asset_registry.get_asset_by_object_path(f"{full_path}.{asset_name}").is_valid():
+            unreal.log_warning(f"Level already exists at {full_path}")
+            if not _confirm(
+                "Level Exists",
+                f"{asset_name} already exists at {full_path}\n\nDo you want to overwrite it?",
+                overwrite,
+                headless_default=True
+            ):
+                unreal.log(f"User cancelled - keeping existing {asset_name}")
+                continue
+        
+        pending.append((asset_name, package_path, full_path))
+    
+    created_worlds = []
+    created_paths = []
+    
+    if pending:
+        with _batched_editor_updates("Creating levels", len(pending)) as task:
+            for asset_name, package_path, full_path in pending:
+                if task.should_cancel():
+                    unreal.log_warning("Level creation cancelled")
+                    break
+                task.enter_progress_frame(1, f"Creating {asset_name}")
+                
+                # Create the asset
+                try:
+                    new_world = asset_tools.create_asset(
+                        asset_name=asset_name,
+                        package_path=package_path,
+                        asset_class=unreal.World,
+                        factory=world_factory
+                    )
+                except Exception as e:
+                    unreal.log_error(f"❌ Error creating {asset_name}: {str(e)}")
+                    continue
+                
+                if new_world:
+                    unreal.log(f"✅ Successfully created {asset_name} at {full_path}")
+                    created_worlds.append(new_world)
+                    created_paths.append(full_path)
+                else:
+                    unreal.log_error(f"❌ Failed to create {asset_name}")
+    
+    # Save all new levels in one batch
+    if created_worlds:
+        if editor_asset_lib.save_loaded_assets(created_worlds):
+            unreal.log(f"✅ Saved {len(created_worlds)} level(s)")
+        else:
+            unreal.log_error("❌ Failed to save new levels")
+            return []
+    
+    return created_paths
+
+def create_space_level(overwrite=None, open_after=None):
+    """Create the SpaceLevel map automatically
+    
+    overwrite and open_after skip the matching dialog when set; when left as
+    None the user is asked, or overwrite=True / open_after=False is assumed
+    if the editor is running unattended.
+    """
     
     # Define the package path
     package_path = "/Game/Maps"
     asset_name = "SpaceLevel"
     full_path = f"{package_path}/{asset_name}"
     
-    # Create the Maps directory if it doesn't exist
-    if not editor_asset_lib.does_directory_exist(package_path):
-        editor_asset_lib.make_directory(package_path)
-        unreal.log(f"Created directory: {package_path}")
-    
-    # Check if level already exists
-    if editor_asset_lib.does_asset_exist(full_path):
-        unreal.log_warning(f"Level already exists at {full_path}")
-        result = unreal.EditorDialog.show_message(
-            "Level Exists",
-            f"SpaceLevel already exists at {full_path}\n\nDo you want to overwrite it?",
-            unreal.AppMsgType.YES_NO
-        )
-        if result == unreal.AppReturnType.NO:
-            unreal.log("User cancelled - keeping existing level")
-            return False
-    
-    # Create a new world
-    world_factory = unreal.WorldFactory()
-    
-    # Create the asset
-    try:
-        new_world = asset_tools.create_asset(
-            asset_name=asset_name,
-            package_path=package_path,
-            asset_class=unreal.World,
-            factory=world_factory
-        )
-        
-        if new_world:
-            unreal.log(f"✅ Successfully created SpaceLevel at {full_path}")
-            
-            # Save the asset
-            editor_asset_lib.save_asset(full_path)
-            unreal.log("✅ SpaceLevel saved")
-            
-            # Optionally load the level
-            load_level = unreal.EditorDialog.show_message(
-                "Success!",
-                "SpaceLevel created successfully!\n\nDo you want to open it now?",
-                unreal.AppMsgType.YES_NO
-            )
-            
-            if load_level == unreal.AppReturnType.YES:
-                unreal.EditorLoadingAndSavingUtils.load_map(full_path)
-                unreal.log("✅ SpaceLevel loaded")
-            
-            # Show final instructions
-            unreal.log("=" * 60)
-            unreal.log("🎮 READY TO PLAY!")
-            unreal.log("=" * 60)
-            unreal.log("Press the PLAY button (or Alt+P) to start the game!")
-            unreal.log("")
-            unreal.log("The game will automatically:")
-            unreal.log("  • Spawn your ship")
-            unreal.log("  • Create lighting")
-            unreal.log("  • Generate asteroids and AI ships")
-            unreal.log("  • Display the HUD with controls")
-            unreal.log("")
-            unreal.log("Controls:")
-            unreal.log("  • W/S - Forward/Backward")
-            unreal.log("  • A/D - Strafe")
-            unreal.log("  • Space/Shift - Up/Down")
-            unreal.log("  • Arrow Keys - Pitch/Yaw")
-            unreal.log("  • Q/E - Roll")
-            unreal.log("  • B - Brake")
-            unreal.log("=" * 60)
-            
-            return True
-        else:
-            unreal.log_error("❌ Failed to create SpaceLevel")
-            return False
-            
-    except Exception as e:
-        unreal.log_error(f"❌ Error creating level: {str(e)}")
+    if full_path not in create_levels([(asset_name, package_path)], overwrite=overwrite):
         return False
+    
+    # Optionally load the level
+    if _confirm(
+        "Success!",
+        "SpaceLevel created successfully!\n\nDo you want to open it now?",
+        open_after,
+        headless_default=False
+    ):
+        unreal.EditorLoadingAndSavingUtils.load_map(full_path)
+        unreal.log("✅ SpaceLevel loaded")
+    
+    # Show final instructions
+    unreal.log(_SUCCESS_BANNER)
+    
+    return True
 
 # Run the function
 if __name__ == "__main__":
-    unreal.log("=" * 60)
-    unreal.log("Creating SpaceLevel...")
-    unreal.log("=" * 60)
-    success = create_space_level()
+    parser = argparse.ArgumentParser(description="Create the SpaceLevel map")
+    parser.add_argument("--overwrite", action=argparse.BooleanOptionalAction, default=None,
+                        help="Overwrite an existing SpaceLevel without asking")
+    parser.add_argument("--open", dest="open_after", action=argparse.BooleanOptionalAction, default=None,
+                        help="Open the level after creating it without asking")
+    args, _ = parser.parse_known_args(getattr(sys, "argv", [])[1:])
+    
+    if unreal is None:
+        sys.exit("create_space_level.py must be run from the Unreal Editor's Python environment")
+    
+    unreal.log("\n".join(["=" * 60, "Creating SpaceLevel...", "=" * 60]))
+    success = create_space_level(overwrite=args.overwrite, open_after=args.open_after)
     if not success:
         unreal.log_warning("Failed to create level. Please try creating it manually:")
-        unreal.log("1. Content Browser → Content/Maps")
-        unreal.log("2. Right-click → Level → Empty Level")
-        unreal.log("3. Name it 'SpaceLevel'")
-        unreal.log("4. Press Play!")
+        unreal.log("\n".join([
+            "1. Content Browser → Content/Maps",
+            "2. Right-click → Level → Empty Level",
+            "3. Name it 'SpaceLevel'",
+            "4. Press Play!",
+        ]))
@@ -4,128 +4,267 @@ Solar System Configuration Generator
 Generates configuration data and helper information for the Sol Testing Grounds
 """
 
-import math
-import json
+import io
+import sys
+from dataclasses import asdict, astuple, dataclass
+from typing import Final
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+@dataclass(frozen=True, slots=True)
+class Planet:
+    """Orbital and physical data for a single planet"""
+    name: str
+    semi_major_axis_au: float
+    eccentricity: float
+    orbital_period_days: float
+    inclination_deg: float
+    longitude_ascending_node_deg: float
+    argument_periapsis_deg: float
+    mean_anomaly_epoch_deg: float
+    diameter_km: float
+    mass_earth_masses: float
+    rotation_period_days: float
+    has_moons: bool
 
 # Real-world planetary data
-PLANETS = [
-    {
-        "name": "Mercury",
-        "semi_major_axis_au": 0.38709893,
-        "eccentricity": 0.20563069,
-        "orbital_period_days": 87.969,
-        "inclination_deg": 7.00487,
-        "longitude_ascending_node_deg": 48.33167,
-        "argument_periapsis_deg": 77.45645,
-        "mean_anomaly_epoch_deg": 252.25084,
-        "diameter_km": 4879.4,
-        "mass_earth_masses": 0.0553,
-        "rotation_period_days": 58.646,
-        "has_moons": False
-    },
-    {
-        "name": "Venus",
-        "semi_major_axis_au": 0.72333199,
-        "eccentricity": 0.00677323,
-        "orbital_period_days": 224.701,
-        "inclination_deg": 3.39471,
-        "longitude_ascending_node_deg": 76.68069,
-        "argument_periapsis_deg": 131.53298,
-        "mean_anomaly_epoch_deg": 181.97973,
-        "diameter_km": 12103.6,
-        "mass_earth_masses": 0.815,
-        "rotation_period_days": 243.018,
-        "has_moons": False
-    },
-    {
-        "name": "Earth",
-        "semi_major_axis_au": 1.00000011,
-        "eccentricity": 0.01671022,
-        "orbital_period_days": 365.256,
-        "inclination_deg": 0.00005,
-        "longitude_ascending_node_deg": -11.26064,
-        "argument_periapsis_deg": 102.94719,
-        "mean_anomaly_epoch_deg": 100.46435,
-        "diameter_km": 12742.0,
-        "mass_earth_masses": 1.0,
-        "rotation_period_days": 1.0,
-        "has_moons": True
-    },
-    {
-        "name": "Mars",
-        "semi_major_axis_au": 1.52366231,
-        "eccentricity": 0.09341233,
-        "orbital_period_days": 686.980,
-        "inclination_deg": 1.85061,
-        "longitude_ascending_node_deg": 49.57854,
-        "argument_periapsis_deg": 336.04084,
-        "mean_anomaly_epoch_deg": 355.45332,
-        "diameter_km": 6779.0,
-        "mass_earth_masses": 0.107,
-        "rotation_period_days": 1.026,
-        "has_moons": True
-    },
-    {
-        "name": "Jupiter",
-        "semi_major_axis_au": 5.20336301,
-        "eccentricity": 0.04839266,
-        "orbital_period_days": 4332.589,
-        "inclination_deg": 1.30530,
-        "longitude_ascending_node_deg": 100.55615,
-        "argument_periapsis_deg": 14.75385,
-        "mean_anomaly_epoch_deg": 34.40438,
-        "diameter_km": 139820.0,
-        "mass_earth_masses": 317.8,
-        "rotation_period_days": 0.414,
-        "has_moons": True
-    },
-    {
-        "name": "Saturn",
-        "semi_major_axis_au": 9.53707032,
-        "eccentricity": 0.05415060,
-        "orbital_period_days": 10759.22,
-        "inclination_deg": 2.48446,
-        "longitude_ascending_node_deg": 113.71504,
-        "argument_periapsis_deg": 92.43194,
-        "mean_anomaly_epoch_deg": 49.94432,
-        "diameter_km": 116460.0,
-        "mass_earth_masses": 95.2,
-        "rotation_period_days": 0.444,
-        "has_moons": True
-    },
-    {
-        "name": "Uranus",
-        "semi_major_axis_au": 19.19126393,
-        "eccentricity": 0.04716771,
-        "orbital_period_days": 30688.5,
-        "inclination_deg": 0.76986,
-        "longitude_ascending_node_deg": 74.22988,
-        "argument_periapsis_deg": 170.96424,
-        "mean_anomaly_epoch_deg": 313.23218,
-        "diameter_km": 50724.0,
-        "mass_earth_masses": 14.5,
-        "rotation_period_days": 0.718,
-        "has_moons": True
-    },
-    {
-        "name": "Neptune",
-        "semi_major_axis_au": 30.06896348,
-        "eccentricity": 0.00858587,
-        "orbital_period_days": 60182.0,
-        "inclination_deg": 1.76917,
-        "longitude_ascending_node_deg": 131.72169,
-        "argument_periapsis_deg": 44.97135,
-        "mean_anomaly_epoch_deg": 304.88003,
-        "diameter_km": 49244.0,
-        "mass_earth_masses": 17.1,
-        "rotation_period_days": 0.671,
-        "has_moons": True
-    }
+PLANETS: Final[tuple[Planet, ...]] = (
+    Planet(
+        name="Mercury",
+        semi_major_axis_au=0.38709893,
+        eccentricity=0.20563069,
+        orbital_period_days=87.969,
+        inclination_deg=7.00487,
+        longitude_ascending_node_deg=48.33167,
+        argument_periapsis_deg=77.45645,
+        mean_anomaly_epoch_deg=252.25084,
+        diameter_km=4879.4,
+        mass_earth_masses=0.0553,
+        rotation_period_days=58.646,
+        has_moons=False,
+    ),
+    Planet(
+        name="Venus",
+        semi_major_axis_au=0.72333199,
+        eccentricity=0.00677323,
+        orbital_period_days=224.701,
+        inclination_deg=3.39471,
+        longitude_ascending_node_deg=76.68069,
+        argument_periapsis_deg=131.53298,
+        mean_anomaly_epoch_deg=181.97973,
+        diameter_km=12103.6,
+        mass_earth_masses=0.815,
+        rotation_period_days=243.018,
+        has_moons=False,
+    ),
+    Planet(
+        name="Earth",
+        semi_major_axis_au=1.00000011,
+        eccentricity=0.01671022,
+        orbital_period_days=365.256,
+        inclination_deg=0.00005,
+        longitude_ascending_node_deg=-11.26064,
+        argument_periapsis_deg=102.94719,
+        mean_anomaly_epoch_deg=100.46435,
+        diameter_km=12742.0,
+        mass_earth_masses=1.0,
+        rotation_period_days=1.0,
+        has_moons=True,
+    ),
+    Planet(
+        name="Mars",
+        semi_major_axis_au=1.52366231,
+        eccentricity=0.09341233,
+        orbital_period_days=686.980,
+        inclination_deg=1.85061,
+        longitude_ascending_node_deg=49.57854,
+        argument_periapsis_deg=336.04084,
+        mean_anomaly_epoch_deg=355.45332,
+        diameter_km=6779.0,
+        mass_earth_masses=0.107,
+        rotation_period_days=1.026,
+        has_moons=True,
+    ),
+    Planet(
+        name="Jupiter",
+        semi_major_axis_au=5.20336301,
+        eccentricity=0.04839266,
+        orbital_period_days=4332.589,
+        inclination_deg=1.30530,
+        longitude_ascending_node_deg=100.55615,
+        argument_periapsis_deg=14.75385,
+        mean_anomaly_epoch_deg=34.40438,
+        diameter_km=139820.0,
+        mass_earth_masses=317.8,
+        rotation_period_days=0.414,
+        has_moons=True,
+    ),
+    Planet(
+        name="Saturn",
+        semi_major_axis_au=9.53707032,
+        eccentricity=0.05415060,
+        orbital_period_days=10759.22,
+        inclination_deg=2.48446,
+        longitude_ascending_node_deg=113.71504,
+        argument_periapsis_deg=92.43194,
+        mean_anomaly_epoch_deg=49.94432,
+        diameter_km=116460.0,
+        mass_earth_masses=95.2,
+        rotation_period_days=0.444,
+        has_moons=True,
+    ),
+    Planet(
+        name="Uranus",
+        semi_major_axis_au=19.19126393,
+        eccentricity=0.04716771,
+        orbital_period_days=30688.5,
+        inclination_deg=0.76986,
+        longitude_ascending_node_deg=74.22988,
+        argument_periapsis_deg=170.96424,
+        mean_anomaly_epoch_deg=313.23218,
+        diameter_km=50724.0,
+        mass_earth_masses=14.5,
+        rotation_period_days=0.718,
+        has_moons=True,
+    ),
+    Planet(
+        name="Neptune",
+        semi_major_axis_au=30.06896348,
+        eccentricity=0.00858587,
+        orbital_period_days=60182.0,
+        inclination_deg=1.76917,
+        longitude_ascending_node_deg=131.72169,
+        argument_periapsis_deg=44.97135,
+        mean_anomaly_epoch_deg=304.88003,
+        diameter_km=49244.0,
+        mass_earth_masses=17.1,
+        rotation_period_days=0.671,
+        has_moons=True,
+    ),
+)
+
+# Packed binary layout of a planet record after the name, matching the Planet field order
+_PLANET_RECORD_FIELDS = [
+    ('a_au', 'f8'),
+    ('e', 'f8'),
+    ('period_d', 'f8'),
+    ('inc_deg', 'f8'),
+    ('lan_deg', 'f8'),
+    ('arg_deg', 'f8'),
+    ('M0_deg', 'f8'),
+    ('diam_km', 'f8'),
+    ('mass_me', 'f8'),
+    ('rot_d', 'f8'),
+    ('has_moons', '?'),
 ]
 
+def planet_dtype(name_width):
+    """Structured dtype for planet records whose names fit in name_width characters"""
+    return np.dtype([('name', f'U{name_width}')] + _PLANET_RECORD_FIELDS)
+
+def planets_to_array(planets):
+    """Pack Planet records into a read-only structured array sized to the longest name"""
+    name_width = max((len(p.name) for p in planets), default=1)
+    arr = np.array([astuple(p) for p in planets], dtype=planet_dtype(name_width))
+    arr.flags.writeable = False
+    return arr
+
+def load_planets_array(filename="solar_system_planets.npy"):
+    """Memory-map a planet array written by export_planets_npy"""
+    return np.load(filename, mmap_mode='r')
+
+# Read-only packed view of PLANETS
+PLANETS_ARR: Final[np.ndarray] = planets_to_array(PLANETS)
+
+def _planet_column(field, scale=1.0):
+    """Gather one Planet field into a contiguous read-only float64 array"""
+    arr = np.array([getattr(p, field) for p in PLANETS], dtype=np.float64) * scale
+    arr.flags.writeable = False
+    return arr
+
+# Planet columns as structure-of-arrays for vectorized math
+SMA_AU: Final[np.ndarray] = _planet_column("semi_major_axis_au")
+DIAM_KM: Final[np.ndarray] = _planet_column("diameter_km")
+ORBIT_DAYS: Final[np.ndarray] = _planet_column("orbital_period_days")
+ECC: Final[np.ndarray] = _planet_column("eccentricity")
+
+# Angular columns stored in radians; the _deg fields on Planet stay for readability
+_DEG_TO_RAD = np.pi / 180.0
+INC_RAD: Final[np.ndarray] = _planet_column("inclination_deg", _DEG_TO_RAD)
+LAN_RAD: Final[np.ndarray] = _planet_column("longitude_ascending_node_deg", _DEG_TO_RAD)
+ARG_RAD: Final[np.ndarray] = _planet_column("argument_periapsis_deg", _DEG_TO_RAD)
+M0_RAD: Final[np.ndarray] = _planet_column("mean_anomaly_epoch_deg", _DEG_TO_RAD)
+
 # Constants
 AU_TO_KM = 149597870.7
 CM_PER_KM = 100000.0
+KM_TO_UU = CM_PER_KM
+AU_TO_UU_BASE = AU_TO_KM * CM_PER_KM  # Unreal units per AU before distance scaling
+
+# Reciprocal time conversions so scaled orbit times are multiplies, not divides
+_INV_60 = 1.0 / 60.0
+_INV_3600 = 1.0 / 3600.0
+_INV_86400 = 1.0 / 86400.0
+
+# Game orbit display format chosen by the first threshold (in hours) exceeded
+_ORBIT_FORMATS = (
+    (24.0, "  Game Orbit: {d:.1f} days ({h:.1f} hours)"),
+    (1.0, "  Game Orbit: {h:.1f} hours ({m:.0f} minutes)"),
+    (float("-inf"), "  Game Orbit: {m:.1f} minutes ({s:.0f} seconds)"),
+)
+
+# Blueprint CSV header line (no field ever needs quoting)
+_CSV_HEADER = ",".join((
+    "PlanetName", "SemiMajorAxisUU", "Eccentricity", "OrbitalPeriodDays",
+    "InclinationDeg", "LongAscNodeDeg", "ArgPeriapsisDeg", "MeanAnomalyDeg",
+    "DiameterKm", "MassEarthMasses", "RotationPeriodDays", "HasMoons"
+)) + "\n"
+
+def solve_kepler(M, e, iters=5):
+    """Solve Kepler's equation E - e*sin(E) = M for all bodies at once
+    
+    Uses a fixed number of Newton steps so every body is updated in the same
+    array operation; five steps converge for solar-system eccentricities.
+    """
+    E = M + e * np.sin(M)
+    for _ in range(iters):
+        E = E - (E - e * np.sin(E) - M) / (1.0 - e * np.cos(E))
+    return E
+
+# Eccentric anomaly of each planet at the epoch
+ECCENTRIC_ANOMALY_EPOCH: Final[np.ndarray] = solve_kepler(M0_RAD, ECC)
+ECCENTRIC_ANOMALY_EPOCH.flags.writeable = False
+
+def _orbital_rotation_matrices(lan, inc, arg):
+    """Build the (N, 3, 3) rotations P = Rz(lan) @ Rx(inc) @ Rz(arg) from angles in radians"""
+    cO, sO = np.cos(lan), np.sin(lan)
+    ci, si = np.cos(inc), np.sin(inc)
+    cw, sw = np.cos(arg), np.sin(arg)
+    
+    P = np.empty((len(lan), 3, 3))
+    P[:, 0, 0] = cO * cw - sO * ci * sw
+    P[:, 0, 1] = -cO * sw - sO * ci * cw
+    P[:, 0, 2] = sO * si
+    P[:, 1, 0] = sO * cw + cO * ci * sw
+    P[:, 1, 1] = -sO * sw + cO * ci * cw
+    P[:, 1, 2] = -cO * si
+    P[:, 2, 0] = si * sw
+    P[:, 2, 1] = si * cw
+    P[:, 2, 2] = ci
+    return P
+
+# Orbital plane to world rotation for each planet (orbital elements are constant)
+P_MATRICES: Final[np.ndarray] = _orbital_rotation_matrices(LAN_RAD, INC_RAD, ARG_RAD)
+P_MATRICES.flags.writeable = False
+
+def transform_orbital(XY):
+    """Rotate per-planet orbital plane coordinates (N, 2) into world coordinates (N, 3)"""
+    return np.einsum('nij,nj->ni', P_MATRICES[:, :, :2], XY)
 
 def calculate_scaled_values(distance_scale=0.00001, size_scale=50.0, time_multiplier=10000.0):
     """Calculate scaled values for Unreal Engine"""
@@ -136,27 +275,26 @@ def calculate_scaled_values(distance_scale=0.00001, size_scale=50.0, time_multip
     print(f"Time Multiplier: {time_multiplier}x")
     print("="*80 + "\n")
     
+    # Calculate distances, sizes and orbit times for all planets at once
+    distances_km = SMA_AU * AU_TO_KM
+    distances_uu = SMA_AU * AU_TO_UU_BASE * distance_scale
+    radii_km = DIAM_KM * 0.5
+    radii_uu = radii_km * KM_TO_UU * size_scale
+    orbits_scaled_seconds = ORBIT_DAYS * 86400.0 / time_multiplier
+    orbits_scaled_minutes = orbits_scaled_seconds * _INV_60
+    orbits_scaled_hours = orbits_scaled_seconds * _INV_3600
+    
     results = []
+    lines = []
     
-    for planet in PLANETS:
-        # Calculate distances
-        distance_km = planet["semi_major_axis_au"] * AU_TO_KM
-        distance_uu = distance_km * CM_PER_KM * distance_scale
-        
-        # Calculate sizes
-        radius_km = planet["diameter_km"] / 2.0
-        radius_uu = radius_km * CM_PER_KM * size_scale
-        
-        # Calculate orbit times with multiplier
-        real_orbit_days = planet["orbital_period_days"]
-        real_orbit_seconds = real_orbit_days * 86400.0
-        scaled_orbit_seconds = real_orbit_seconds / time_multiplier
-        scaled_orbit_minutes = scaled_orbit_seconds / 60.0
-        scaled_orbit_hours = scaled_orbit_minutes / 60.0
-        
+    for (planet, distance_km, distance_uu, radius_km, radius_uu, real_orbit_days,
+         scaled_orbit_seconds, scaled_orbit_minutes, scaled_orbit_hours) in zip(
+            PLANETS, distances_km.tolist(), distances_uu.tolist(), radii_km.tolist(),
+            radii_uu.tolist(), ORBIT_DAYS.tolist(), orbits_scaled_seconds.tolist(),
+            orbits_scaled_minutes.tolist(), orbits_scaled_hours.tolist()):
         result = {
-            "name": planet["name"],
-            "distance_au": planet["semi_major_axis_au"],
+            "name": planet.name,
+            "distance_au": planet.semi_major_axis_au,
             "distance_km": distance_km,
             "distance_uu": distance_uu,
             "distance_game_km": distance_uu / CM_PER_KM,
@@ -171,70 +309,86 @@ def calculate_scaled_values(distance_scale=0.00001, size_scale=50.0, time_multip
         
         results.append(result)
         
-        # Print readable output
-        print(f"{planet['name']}:")
-        print(f"  Real Distance: {planet['semi_major_axis_au']:.3f} AU ({distance_km:,.0f} km)")
-        print(f"  Game Distance: {result['distance_game_km']:,.0f} km ({distance_uu:,.0f} UU)")
-        print(f"  Real Radius: {radius_km:,.0f} km")
-        print(f"  Game Radius: {result['radius_game_km']:,.1f} km ({radius_uu:,.0f} UU)")
-        print(f"  Real Orbit: {real_orbit_days:.1f} days")
+        # Collect readable output
+        lines.append(f"{planet.name}:")
+        lines.append(f"  Real Distance: {planet.semi_major_axis_au:.3f} AU ({distance_km:,.0f} km)")
+        lines.append(f"  Game Distance: {result['distance_game_km']:,.0f} km ({distance_uu:,.0f} UU)")
+        lines.append(f"  Real Radius: {radius_km:,.0f} km")
+        lines.append(f"  Game Radius: {result['radius_game_km']:,.1f} km ({radius_uu:,.0f} UU)")
+        lines.append(f"  Real Orbit: {real_orbit_days:.1f} days")
         
-        if scaled_orbit_hours > 24:
-            print(f"  Game Orbit: {scaled_orbit_hours/24:.1f} days ({scaled_orbit_hours:.1f} hours)")
-        elif scaled_orbit_hours > 1:
-            print(f"  Game Orbit: {scaled_orbit_hours:.1f} hours ({scaled_orbit_minutes:.0f} minutes)")
-        else:
-            print(f"  Game Orbit: {scaled_orbit_minutes:.1f} minutes ({scaled_orbit_seconds:.0f} seconds)")
-        print()
+        # Fall back to the last format when nothing matches (e.g. NaN hours)
+        orbit_fmt = next(
+            (fmt for threshold, fmt in _ORBIT_FORMATS if scaled_orbit_hours > threshold),
+            _ORBIT_FORMATS[-1][1]
+        )
+        lines.append(orbit_fmt.format(
+            d=scaled_orbit_seconds * _INV_86400,
+            h=scaled_orbit_hours,
+            m=scaled_orbit_minutes,
+            s=scaled_orbit_seconds
+        ))
+        lines.append("")
+    
+    # Write all planet blocks in one call
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return results
 
-def generate_blueprint_csv(distance_scale=0.00001, size_scale=50.0):
-    """Generate CSV for easy import to Blueprint/Excel"""
+def generate_blueprint_csv(results):
+    """Generate CSV for easy import to Blueprint/Excel from calculate_scaled_values results"""
     print("\n" + "="*80)
     print("CSV FORMAT FOR BLUEPRINT IMPORT")
     print("="*80 + "\n")
     
-    print("PlanetName,SemiMajorAxisUU,Eccentricity,OrbitalPeriodDays,InclinationDeg,LongAscNodeDeg,ArgPeriapsisDeg,MeanAnomalyDeg,DiameterKm,MassEarthMasses,RotationPeriodDays,HasMoons")
+    buf = io.StringIO()
+    buf.write(_CSV_HEADER)
     
-    for planet in PLANETS:
-        distance_km = planet["semi_major_axis_au"] * AU_TO_KM
-        distance_uu = distance_km * CM_PER_KM * distance_scale
-        
-        print(f"{planet['name']},{distance_uu:.2f},{planet['eccentricity']:.8f},"
-              f"{planet['orbital_period_days']:.3f},{planet['inclination_deg']:.5f},"
-              f"{planet['longitude_ascending_node_deg']:.5f},"
-              f"{planet['argument_periapsis_deg']:.5f},"
-              f"{planet['mean_anomaly_epoch_deg']:.5f},{planet['diameter_km']:.1f},"
-              f"{planet['mass_earth_masses']:.3f},{planet['rotation_period_days']:.3f},"
-              f"{'TRUE' if planet['has_moons'] else 'FALSE'}")
+    for planet, result in zip(PLANETS, results):
+        buf.write(f"{planet.name},{result['distance_uu']:.2f},{planet.eccentricity:.8f},"
+                  f"{planet.orbital_period_days:.3f},{planet.inclination_deg:.5f},"
+                  f"{planet.longitude_ascending_node_deg:.5f},"
+                  f"{planet.argument_periapsis_deg:.5f},"
+                  f"{planet.mean_anomaly_epoch_deg:.5f},{planet.diameter_km:.1f},"
+                  f"{planet.mass_earth_masses:.3f},{planet.rotation_period_days:.3f},"
+                  f"{'TRUE' if planet.has_moons else 'FALSE'}\n")
+    
+    sys.stdout.write(buf.getvalue())
 
-def calculate_camera_distances():
-    """Calculate recommended camera distances for viewing planets"""
+def calculate_camera_distances(results):
+    """Calculate recommended camera distances for viewing planets from calculate_scaled_values results"""
     print("\n" + "="*80)
     print("RECOMMENDED CAMERA DISTANCES")
     print("="*80 + "\n")
     
-    distance_scale = 0.00001
-    size_scale = 50.0
-    
-    for planet in PLANETS:
-        radius_km = planet["diameter_km"] / 2.0
-        radius_uu = radius_km * CM_PER_KM * size_scale
+    for result in results:
+        radius_uu = result["radius_uu"]
         
         # Good viewing distance is roughly 3-5x planet radius
         min_distance = radius_uu * 3
         max_distance = radius_uu * 5
         
-        print(f"{planet['name']}:")
+        print(f"{result['name']}:")
         print(f"  Planet Radius: {radius_uu:,.0f} UU")
         print(f"  Min View Distance: {min_distance:,.0f} UU ({min_distance/CM_PER_KM:,.0f} km)")
         print(f"  Max View Distance: {max_distance:,.0f} UU ({max_distance/CM_PER_KM:,.0f} km)")
         print()
 
+def _dump_json(obj):
+    """Encode obj as 2-space indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    
+    import json
+    return json.dumps(obj, indent=2, default=asdict).encode()
+
 def export_json_config(filename="solar_system_config.json"):
-    """Export configuration as JSON"""
-    config = {
+    """Export configuration as JSON
+    
+    Planets are encoded and written one at a time so the full document is
+    never built in memory.
+    """
+    header = {
         "version": "1.0",
         "date_created": "2026-01-08",
         "scale_factors": {
@@ -246,15 +400,31 @@ def export_json_config(filename="solar_system_config.json"):
             "au_to_km": AU_TO_KM,
             "cm_per_km": CM_PER_KM,
             "sun_diameter_km": 1392700.0
-        },
-        "planets": PLANETS
+        }
     }
     
-    with open(filename, 'w') as f:
-        json.dump(config, f, indent=2)
+    # JSON encoders escape newlines inside strings, so every raw newline in
+    # encoded output is layout and can be re-indented for nesting
+    with open(filename, 'wb') as f:
+        f.write(b'{')
+        for key, value in header.items():
+            f.write(b'\n  ' + _dump_json(key) + b': ')
+            f.write(_dump_json(value).replace(b'\n', b'\n  ') + b',')
+        f.write(b'\n  "planets": [')
+        for i, planet in enumerate(PLANETS):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(_dump_json(planet).replace(b'\n', b'\n    '))
+        f.write(b'\n  ]' if PLANETS else b']')
+        f.write(b'\n}')
     
     print(f"\n✓ Exported configuration to {filename}")
 
+def export_planets_npy(filename="solar_system_planets.npy"):
+    """Export planet data as a binary NumPy sidecar to the JSON config"""
+    np.save(filename, PLANETS_ARR)
+    
+    print(f"✓ Exported planet array to {filename}")
+
 def main():
     """Main entry point"""
     print("\n" + "="*80)
@@ -269,13 +439,14 @@ def main():
     )
     
     # Generate CSV for easy reference
-    generate_blueprint_csv()
+    generate_blueprint_csv(results)
     
     # Calculate camera distances
-    calculate_camera_distances()
+    calculate_camera_distances(results)
     
     # Export JSON config
     export_json_config()
+    export_planets_npy()
     
     print("\n" + "="*80)
     print("Generation Complete!")